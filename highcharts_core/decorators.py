@@ -245,6 +245,20 @@ def class_sensitive(types = None,
       :class:`HighchartsMeta` interface definition
 
     """
+    try:
+        primary_type = [x for x in types][0]
+    except (TypeError, IndexError):
+        primary_type = types
+
+    # Values that validate_types() would return unchanged skip it entirely: None
+    # (when allowed) and non-empty instances of the primary type.
+    if (
+        force_iterable or
+        not isinstance(primary_type, type) or
+        issubclass(primary_type, (str, bytes, dict))
+    ):
+        primary_type = None
+
     def decorator(func):
         @wraps(func)
         def func_wrapper(*args,
@@ -257,6 +271,12 @@ def class_sensitive(types = None,
                 raise errors.HighchartsError('Something went wrong. Unsure how this '
                                              'might happen.')
 
+            if primary_type is not None:
+                if value is None and allow_none:
+                    return func(args[0], value)
+                if isinstance(value, primary_type) and value:
+                    return func(args[0], value)
+
             value = validate_types(value,
                                    types = types,
                                    allow_dict = allow_dict,
@@ -27,6 +27,8 @@ class HighchartsMeta(ABC):
     """Metaclass that is used to define the standard interface exposed for serializable
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         for key in kwargs:
             setattr(self, key, kwargs.get(key, None))
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import errors, utility_functions
 from highcharts_core.decorators import validate_types
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.animation import AnimationOptions
@@ -15,6 +15,10 @@ class AxisMarker(HighchartsMeta):
     """The triangular marker on a scalar color axis that points to the value of the
     hovered area."""
 
+    __slots__ = ('_animation',
+                 '_color',
+                 '_width')
+
     def __init__(self, **kwargs):
         self._animation = None
         self._color = None
@@ -57,7 +61,9 @@ class AxisMarker(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        from highcharts_core import utility_functions
+        if value is self._color:
+            return
+
         self._color = utility_functions.validate_color(value)
 
     @property
@@ -71,7 +77,10 @@ class AxisMarker(HighchartsMeta):
 
     @width.setter
     def width(self, value):
-        self._width = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._width = value
+        else:
+            self._width = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -13,6 +13,22 @@ from highcharts_core.utility_classes.patterns import Pattern
 class PaneBackground(HighchartsMeta):
     """Configuration of the background items to display within a :class:`Pane`."""
 
+    __slots__ = ('_background_color',
+                 '_border_color',
+                 '_border_width',
+                 '_class_name',
+                 '_inner_radius',
+                 '_outer_radius',
+                 '_shape')
+
+    _untrimmed_fields = (('backgroundColor', 'background_color'),
+                         ('borderColor', 'border_color'),
+                         ('borderWidth', 'border_width'),
+                         ('className', 'class_name'),
+                         ('innerRadius', 'inner_radius'),
+                         ('outerRadius', 'outer_radius'),
+                         ('shape', 'shape'))
+
     def __init__(self, **kwargs):
         self._background_color = None
         self._border_color = None
@@ -43,6 +59,9 @@ class PaneBackground(HighchartsMeta):
 
     @background_color.setter
     def background_color(self, value):
+        if value is self._background_color:
+            return
+
         self._background_color = utility_functions.validate_color(value)
 
     @property
@@ -59,6 +78,9 @@ class PaneBackground(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
+        if value is self._border_color:
+            return
+
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -73,7 +95,10 @@ class PaneBackground(HighchartsMeta):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._border_width = value
+        else:
+            self._border_width = validators.numeric(value, allow_empty = True)
 
     @property
     def class_name(self) -> Optional[str]:
@@ -87,7 +112,12 @@ class PaneBackground(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        if not value:
+            self._class_name = None
+        elif isinstance(value, str):
+            self._class_name = value
+        else:
+            self._class_name = validators.string(value, allow_empty = True)
 
     @property
     def inner_radius(self) -> Optional[int | float | Decimal | str]:
@@ -103,11 +133,10 @@ class PaneBackground(HighchartsMeta):
     def inner_radius(self, value):
         if value is None or value == '':
             self._inner_radius = None
+        elif isinstance(value, str):
+            self._inner_radius = value
         else:
-            try:
-                self._inner_radius = validators.string(value, allow_empty = True)
-            except ValueError:
-                self._inner_radius = validators.numeric(value, allow_empty = True)
+            self._inner_radius = validators.numeric(value, allow_empty = True)
 
     @property
     def outer_radius(self) -> Optional[int | float | Decimal | str]:
@@ -124,11 +153,10 @@ class PaneBackground(HighchartsMeta):
     def outer_radius(self, value):
         if value is None or value == '':
             self._outer_radius = None
+        elif isinstance(value, str):
+            self._outer_radius = value
         else:
-            try:
-                self._outer_radius = validators.string(value, allow_empty = True)
-            except ValueError:
-                self._outer_radius = validators.numeric(value, allow_empty = True)
+            self._outer_radius = validators.numeric(value, allow_empty = True)
 
     @property
     def shape(self) -> Optional[str]:
@@ -153,12 +181,16 @@ class PaneBackground(HighchartsMeta):
 
     @shape.setter
     def shape(self, value):
+        if value is self._shape:
+            return
+
         if not value:
             self._shape = None
         else:
-            value = validators.string(value)
+            if not isinstance(value, str):
+                value = validators.string(value)
             value = value.lower()
-            if value not in ['circle', 'solid', 'arc']:
+            if value not in {'circle', 'solid', 'arc'}:
                 raise errors.HighchartsValueError(f'shape expects "circle", "solid", or '
                                                   f'"arc". Received: {value}')
             self._shape = value
@@ -178,23 +210,27 @@ class PaneBackground(HighchartsMeta):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'backgroundColor': self.background_color,
-            'borderColor': self.border_color,
-            'borderWidth': self.border_width,
-            'className': self.class_name,
-            'innerRadius': self.inner_radius,
-            'outerRadius': self.outer_radius,
-            'shape': self.shape
-        }
-
-        return untrimmed
+        return utility_functions.fields_to_untrimmed_dict(self, self._untrimmed_fields)
 
 
 class Pane(HighchartsMeta):
     """The pane serves as a container for axes and backgrounds for circular gauges and
     polar charts."""
 
+    __slots__ = ('_background',
+                 '_center',
+                 '_end_angle',
+                 '_inner_size',
+                 '_size',
+                 '_start_angle')
+
+    _untrimmed_fields = (('background', 'background'),
+                         ('center', 'center'),
+                         ('endAngle', 'end_angle'),
+                         ('innerSize', 'inner_size'),
+                         ('size', 'size'),
+                         ('startAngle', 'start_angle'))
+
     def __init__(self, **kwargs):
         self._background = None
         self._center = None
@@ -243,24 +279,19 @@ class Pane(HighchartsMeta):
         if not value:
             self._center = None
         else:
-            value = validators.iterable(value,
-                                        allow_empty = False,
-                                        minimum_length = 2,
-                                        maximum_length = 2)
-            validated = []
-            for item in value:
-                try:
-                    item = validators.string(item)
-                    if '%' not in item:
-                        raise errors.HighchartsValueError('center expects either a '
-                                                          'numeric value or a percentage '
-                                                          'string. No "%"" symbol found.')
-                except ValueError:
-                    item = validators.numeric(item)
-
-                validated.append(item)
-
-            self._center = validated
+            if isinstance(value, (str, bytes)):
+                raise errors.HighchartsValueError(f'center expects a two-member '
+                                                  f'iterable, not a string. Received: '
+                                                  f'{value}')
+            try:
+                x, y = value
+            except (TypeError, ValueError):
+                raise errors.HighchartsValueError(f'center expects a two-member '
+                                                  f'iterable. Received: {value}')
+
+            self._center = [item if isinstance(item, str) and '%' in item
+                            else validators.numeric(item)
+                            for item in (x, y)]
 
     @property
     def end_angle(self) -> Optional[int | float | Decimal]:
@@ -273,7 +304,10 @@ class Pane(HighchartsMeta):
 
     @end_angle.setter
     def end_angle(self, value):
-        self._end_angle = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._end_angle = value
+        else:
+            self._end_angle = validators.numeric(value, allow_empty = True)
 
     @property
     def inner_size(self) -> Optional[int | float | Decimal | str]:
@@ -289,11 +323,10 @@ class Pane(HighchartsMeta):
     def inner_size(self, value):
         if not value:
             self._inner_size = None
+        elif isinstance(value, str):
+            self._inner_size = value
         else:
-            try:
-                self._inner_size = validators.string(value)
-            except ValueError:
-                self._inner_size = validators.numeric(value)
+            self._inner_size = validators.numeric(value)
 
     @property
     def size(self) -> Optional[int | float | Decimal | str]:
@@ -309,15 +342,10 @@ class Pane(HighchartsMeta):
     def size(self, value):
         if not value:
             self._size = None
+        elif isinstance(value, str) and '%' in value:
+            self._size = value
         else:
-            try:
-                value = validators.string(value)
-                if '%' not in value:
-                    raise errors.HighchartsValueError('size expects either a number or '
-                                                      'a percentage string. No "%" '
-                                                      'symbol found.')
-            except (ValueError, TypeError):
-                self._size = validators.numeric(value)
+            self._size = validators.numeric(value)
 
     @property
     def start_angle(self) -> Optional[int | float | Decimal]:
@@ -330,7 +358,10 @@ class Pane(HighchartsMeta):
 
     @start_angle.setter
     def start_angle(self, value):
-        self._start_angle = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._start_angle = value
+        else:
+            self._start_angle = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -346,13 +377,4 @@ class Pane(HighchartsMeta):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'background': self.background,
-            'center': self.center,
-            'endAngle': self.end_angle,
-            'innerSize': self.inner_size,
-            'size': self.size,
-            'startAngle': self.start_angle
-        }
-
-        return untrimmed
+        return utility_functions.fields_to_untrimmed_dict(self, self._untrimmed_fields)
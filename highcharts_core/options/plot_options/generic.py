@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 from typing import Optional, List
 from decimal import Decimal
 
 from validator_collection import validators, checkers
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta, JavaScriptDict
 from highcharts_core.options.plot_options.accessibility import TypeOptionsAccessibility
@@ -21,12 +23,89 @@ from highcharts_core.utility_classes.markers import Marker
 from highcharts_core.utility_classes.states import States
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
 
+_CURSORS = frozenset(constants.SUPPORTED_CURSOR_VALUES)
+_DASH_STYLES = frozenset(constants.SUPPORTED_DASH_STYLE_VALUES)
+
 
 class GenericTypeOptions(HighchartsMeta):
     """Generic class that is used as a base class for type-specific :class:`PlotOptions`.
     """
 
+    __slots__ = ('_accessibility',
+                 '_allow_point_select',
+                 '_animation',
+                 '_class_name',
+                 '_clip',
+                 '_color',
+                 '_cursor',
+                 '_custom',
+                 '_dash_style',
+                 '_data_labels',
+                 '_description',
+                 '_enable_mouse_tracking',
+                 '_events',
+                 '_include_in_data_export',
+                 '_keys',
+                 '_label',
+                 '_linked_to',
+                 '_marker',
+                 '_on_point',
+                 '_opacity',
+                 '_point',
+                 '_point_description_formatter',
+                 '_selected',
+                 '_show_checkbox',
+                 '_show_in_legend',
+                 '_skip_keyboard_navigation',
+                 '_sonification',
+                 '_states',
+                 '_sticky_tracking',
+                 '_threshold',
+                 '_tooltip',
+                 '_turbo_threshold',
+                 '_visible')
+
+    _untrimmed_fields = (('accessibility', 'accessibility'),
+                         ('allowPointSelect', 'allow_point_select'),
+                         ('animation', 'animation'),
+                         ('className', 'class_name'),
+                         ('clip', 'clip'),
+                         ('color', 'color'),
+                         ('cursor', 'cursor'),
+                         ('custom', 'custom'),
+                         ('dashStyle', 'dash_style'),
+                         ('dataLabels', 'data_labels'),
+                         ('description', 'description'),
+                         ('enableMouseTracking', 'enable_mouse_tracking'),
+                         ('events', 'events'),
+                         ('includeInDataExport', 'include_in_data_export'),
+                         ('keys', 'keys'),
+                         ('label', 'label'),
+                         ('linkedTo', 'linked_to'),
+                         ('marker', 'marker'),
+                         ('onPoint', 'on_point'),
+                         ('opacity', 'opacity'),
+                         ('point', 'point'),
+                         ('pointDescriptionFormatter', 'point_description_formatter'),
+                         ('selected', 'selected'),
+                         ('showCheckbox', 'show_checkbox'),
+                         ('showInLegend', 'show_in_legend'),
+                         ('skipKeyboardNavigation', 'skip_keyboard_navigation'),
+                         ('sonification', 'sonification'),
+                         ('states', 'states'),
+                         ('stickyTracking', 'sticky_tracking'),
+                         ('threshold', 'threshold'),
+                         ('tooltip', 'tooltip'),
+                         ('turboThreshold', 'turbo_threshold'),
+                         ('visible', 'visible'))
+
+    _kwargs_fields = _untrimmed_fields
+
     def __init__(self, **kwargs):
+        if 'type' in kwargs:
+            raise errors.HighchartsReadOnlyError('type is a read-only property and cannot '
+                                                 'be set manually')
+
         self._accessibility = None
         self._allow_point_select = None
         self._animation = None
@@ -95,8 +174,6 @@ class GenericTypeOptions(HighchartsMeta):
         self.turbo_threshold = kwargs.get('turbo_threshold', None)
         self.visible = kwargs.get('visible', None)
 
-        super().__init__(**kwargs)
-
     @property
     def type(self) -> str:
         """Indicates the type of series that is represented by this instance.
@@ -151,8 +228,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @allow_point_select.setter
     def allow_point_select(self, value):
-        if value is None:
-            self._allow_point_select = None
+        if value is None or isinstance(value, bool):
+            self._allow_point_select = value
         else:
             self._allow_point_select = bool(value)
 
@@ -212,8 +289,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @clip.setter
     def clip(self, value):
-        if value is None:
-            self._clip = None
+        if value is None or isinstance(value, bool):
+            self._clip = value
         else:
             self._clip = bool(value)
 
@@ -233,7 +310,6 @@ class GenericTypeOptions(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        from highcharts_core import utility_functions
         self._color = utility_functions.validate_color(value)
 
     @property
@@ -288,9 +364,11 @@ class GenericTypeOptions(HighchartsMeta):
         if not value:
             self._cursor = None
         else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in constants.SUPPORTED_CURSOR_VALUES:
+            if not isinstance(value, str):
+                value = validators.string(value)
+            if not value.islower():
+                value = value.lower()
+            if value not in _CURSORS:
                 raise errors.HighchartsValueError(f'cursor expects a valid cursor value. '
                                                   f'Received: {value}')
             self._cursor = value
@@ -339,8 +417,9 @@ class GenericTypeOptions(HighchartsMeta):
         if not value:
             self._dash_style = None
         else:
-            value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if not isinstance(value, str):
+                value = validators.string(value)
+            if value not in _DASH_STYLES:
                 raise errors.HighchartsValueError(f'dash_style expects a recognized value'
                                                   f', but received: {value}')
             self._dash_style = value
@@ -363,16 +442,25 @@ class GenericTypeOptions(HighchartsMeta):
     def data_labels(self, value):
         if not value:
             self._data_labels = None
+        elif isinstance(value, DataLabel):
+            self._data_labels = value
+        elif isinstance(value, dict):
+            self._data_labels = DataLabel.from_dict(value)
+        elif isinstance(value, (list, tuple)):
+            self._data_labels = [x if isinstance(x, DataLabel)
+                                 else validate_types(x,
+                                                     types = DataLabel,
+                                                     force_iterable = True)
+                                 for x in value]
+        elif checkers.is_iterable(value):
+            self._data_labels = validate_types(value,
+                                               types = DataLabel,
+                                               allow_none = False,
+                                               force_iterable = True)
         else:
-            if checkers.is_iterable(value):
-                self._data_labels = validate_types(value,
-                                                   types = DataLabel,
-                                                   allow_none = False,
-                                                   force_iterable = True)
-            else:
-                self._data_labels = validate_types(value,
-                                                   types = DataLabel,
-                                                   allow_none = False)
+            self._data_labels = validate_types(value,
+                                               types = DataLabel,
+                                               allow_none = False)
 
     @property
     def description(self) -> Optional[str]:
@@ -399,8 +487,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @enable_mouse_tracking.setter
     def enable_mouse_tracking(self, value):
-        if value is None:
-            self._enable_mouse_tracking = None
+        if value is None or isinstance(value, bool):
+            self._enable_mouse_tracking = value
         else:
             self._enable_mouse_tracking = bool(value)
 
@@ -433,8 +521,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @include_in_data_export.setter
     def include_in_data_export(self, value):
-        if value is None:
-            self._include_in_data_export = None
+        if value is None or isinstance(value, bool):
+            self._include_in_data_export = value
         else:
             self._include_in_data_export = bool(value)
 
@@ -455,7 +543,7 @@ class GenericTypeOptions(HighchartsMeta):
         if not value:
             self._keys = None
         else:
-            self._keys = [validators.string(x)
+            self._keys = [x if x and isinstance(x, str) else validators.string(x)
                           for x in validators.iterable(value)]
 
     @property
@@ -591,8 +679,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @selected.setter
     def selected(self, value):
-        if value is None:
-            self._selected = None
+        if value is None or isinstance(value, bool):
+            self._selected = value
         else:
             self._selected = bool(value)
 
@@ -612,8 +700,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @show_checkbox.setter
     def show_checkbox(self, value):
-        if value is None:
-            self._show_checkbox = None
+        if value is None or isinstance(value, bool):
+            self._show_checkbox = value
         else:
             self._show_checkbox = bool(value)
 
@@ -628,8 +716,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @show_in_legend.setter
     def show_in_legend(self, value):
-        if value is None:
-            self._show_in_legend = None
+        if value is None or isinstance(value, bool):
+            self._show_in_legend = value
         else:
             self._show_in_legend = bool(value)
 
@@ -644,8 +732,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @skip_keyboard_navigation.setter
     def skip_keyboard_navigation(self, value):
-        if value is None:
-            self._skip_keyboard_navigation = None
+        if value is None or isinstance(value, bool):
+            self._skip_keyboard_navigation = value
         else:
             self._skip_keyboard_navigation = bool(value)
 
@@ -703,8 +791,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @sticky_tracking.setter
     def sticky_tracking(self, value):
-        if value is None:
-            self._sticky_tracking = None
+        if value is None or isinstance(value, bool):
+            self._sticky_tracking = value
         else:
             self._sticky_tracking = bool(value)
 
@@ -721,7 +809,9 @@ class GenericTypeOptions(HighchartsMeta):
 
     @threshold.setter
     def threshold(self, value):
-        if value == constants.EnforcedNull:
+        if value is None or isinstance(value, (int, float)):
+            self._threshold = value
+        elif value == constants.EnforcedNull:
             self._threshold = constants.EnforcedNull
         else:
             self._threshold = validators.numeric(value, allow_empty = True)
@@ -762,9 +852,12 @@ class GenericTypeOptions(HighchartsMeta):
 
     @turbo_threshold.setter
     def turbo_threshold(self, value):
-        self._turbo_threshold = validators.integer(value,
-                                                   allow_empty = True,
-                                                   minimum = 0)
+        if value is None or (isinstance(value, int) and value >= 0):
+            self._turbo_threshold = value
+        else:
+            self._turbo_threshold = validators.integer(value,
+                                                       allow_empty = True,
+                                                       minimum = 0)
 
     @property
     def visible(self) -> Optional[bool]:
@@ -777,8 +870,8 @@ class GenericTypeOptions(HighchartsMeta):
 
     @visible.setter
     def visible(self, value):
-        if value is None:
-            self._visible = None
+        if value is None or isinstance(value, bool):
+            self._visible = value
         else:
             self._visible = bool(value)
 
@@ -795,80 +888,15 @@ class GenericTypeOptions(HighchartsMeta):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None)
-        }
+        kwargs = {name: as_dict.get(key, None) for key, name in cls._kwargs_fields}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'accessibility': self.accessibility,
-            'allowPointSelect': self.allow_point_select,
-            'animation': self.animation,
-            'className': self.class_name,
-            'clip': self.clip,
-            'color': self.color,
-            'cursor': self.cursor,
-            'custom': self.custom,
-            'dashStyle': self.dash_style,
-            'dataLabels': self.data_labels,
-            'description': self.description,
-            'enableMouseTracking': self.enable_mouse_tracking,
-            'events': self.events,
-            'includeInDataExport': self.include_in_data_export,
-            'keys': self.keys,
-            'label': self.label,
-            'linkedTo': self.linked_to,
-            'marker': self.marker,
-            'onPoint': self.on_point,
-            'opacity': self.opacity,
-            'point': self.point,
-            'pointDescriptionFormatter': self.point_description_formatter,
-            'selected': self.selected,
-            'showCheckbox': self.show_checkbox,
-            'showInLegend': self.show_in_legend,
-            'skipKeyboardNavigation': self.skip_keyboard_navigation,
-            'sonification': self.sonification,
-            'states': self.states,
-            'stickyTracking': self.sticky_tracking,
-            'threshold': self.threshold,
-            'tooltip': self.tooltip,
-            'turboThreshold': self.turbo_threshold,
-            'visible': self.visible,
-            'type': self.type
-        }
+        untrimmed = utility_functions.fields_to_untrimmed_dict(self, self._untrimmed_fields)
+
+        type_ = self.type
+        if type_ is not None:
+            untrimmed['type'] = type_
 
         return untrimmed
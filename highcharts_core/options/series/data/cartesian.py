@@ -160,13 +160,15 @@ class CartesianData(DataBase):
 
         collection = []
         for item in value:
-            if checkers.is_type(item, 'CartesianData'):
+            if item is None or isinstance(item, (int, float)):
+                as_obj = cls(y = item)
+            elif checkers.is_type(item, 'CartesianData'):
                 as_obj = item
             elif checkers.is_dict(item):
                 as_obj = cls.from_dict(item)
             elif isinstance(item, constants.EnforcedNullType):
                 as_obj = cls(y = constants.EnforcedNull)
-            elif item is None or checkers.is_numeric(item):
+            elif checkers.is_numeric(item):
                 as_obj = cls(y = item)
             elif checkers.is_iterable(item):
                 if len(item) == 2:
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators, checkers
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.options.series.data.base import DataBase
 from highcharts_core.options.plot_options.drag_drop import DragDropOptions
@@ -13,6 +13,27 @@ from highcharts_core.utility_classes.data_labels import DataLabel
 class WordcloudData(DataBase):
     """Data point that features a single and ``y`` value."""
 
+    __slots__ = ('_data_labels',
+                 '_drag_drop',
+                 '_weight')
+
+    _untrimmed_fields = (('dataLabels', 'data_labels'),
+                         ('dragDrop', 'drag_drop'),
+                         ('weight', 'weight'),
+                         ('accessibility', 'accessibility'),
+                         ('className', 'class_name'),
+                         ('color', 'color'),
+                         ('colorIndex', 'color_index'),
+                         ('custom', 'custom'),
+                         ('description', 'description'),
+                         ('events', 'events'),
+                         ('id', 'id'),
+                         ('labelrank', 'label_rank'),
+                         ('name', 'name'),
+                         ('selected', 'selected'))
+
+    _kwargs_fields = dict(_untrimmed_fields)
+
     def __init__(self, **kwargs):
         self._data_labels = None
         self._drag_drop = None
@@ -73,12 +94,17 @@ class WordcloudData(DataBase):
 
     @weight.setter
     def weight(self, value):
-        self._weight = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._weight = value
+        else:
+            self._weight = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def from_array(cls, value):
         if not value:
             return []
+        elif isinstance(value, list) and all(isinstance(item, cls) for item in value):
+            return list(value)
         elif checkers.is_string(value):
             try:
                 value = validators.json(value)
@@ -89,12 +115,14 @@ class WordcloudData(DataBase):
 
         collection = []
         for item in value:
-            if checkers.is_type(item, 'WordcloudData'):
+            if isinstance(item, cls):
                 as_obj = item
-            elif checkers.is_dict(item):
+            elif isinstance(item, dict):
                 as_obj = cls.from_dict(item)
             elif item is None or isinstance(item, constants.EnforcedNullType):
                 as_obj = cls()
+            elif checkers.is_dict(item):
+                as_obj = cls.from_dict(item)
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
                                                   f'be a Wordcloud Data Point or be '
@@ -117,47 +145,13 @@ class WordcloudData(DataBase):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelrank', None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-
-            'weight': as_dict.get('weight', None),
-        }
+        kwargs = {}
+        for key, value in as_dict.items():
+            name = cls._kwargs_fields.get(key)
+            if name is not None:
+                kwargs[name] = value
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-
-            'weight': self.weight,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-
-
-        }
-
-        return untrimmed
+        return utility_functions.fields_to_untrimmed_dict(self, self._untrimmed_fields)
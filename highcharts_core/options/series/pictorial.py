@@ -6,7 +6,7 @@ from validator_collection import validators
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.cartesian import CartesianData
 from highcharts_core.options.plot_options.pictorial import PictorialOptions
-from highcharts_core.utility_functions import mro__to_untrimmed_dict
+from highcharts_core.utility_functions import mro__to_untrimmed_dict, fields_to_untrimmed_dict
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.utility_classes.ast import AttributeObject
@@ -14,7 +14,13 @@ from highcharts_core.utility_classes.ast import AttributeObject
 
 class PictorialPaths(HighchartsMeta):
     """Configuration of pictorial point images."""
-    
+
+    __slots__ = ('_definition',
+                 '_max')
+
+    _untrimmed_fields = (('definition', 'definition'),
+                         ('max', 'max'))
+
     def __init__(self, **kwargs):
         self._definition = None
         self._max = None
@@ -48,7 +54,10 @@ class PictorialPaths(HighchartsMeta):
     
     @max.setter
     def max(self, value):
-        self._max = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float)):
+            self._max = value
+        else:
+            self._max = validators.numeric(value, allow_empty = True)
 
 
     @classmethod
@@ -61,12 +70,7 @@ class PictorialPaths(HighchartsMeta):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'definition': self.definition,
-            'max': self.max
-        }
-
-        return untrimmed
+        return fields_to_untrimmed_dict(self, self._untrimmed_fields)
 
 
 class PictorialSeries(SeriesBase, PictorialOptions):
@@ -81,6 +85,91 @@ class PictorialSeries(SeriesBase, PictorialOptions):
 
     """
 
+    _kwargs_fields = (
+        ('accessibility', 'accessibility'),
+        ('allowPointSelect', 'allow_point_select'),
+        ('animation', 'animation'),
+        ('className', 'class_name'),
+        ('clip', 'clip'),
+        ('color', 'color'),
+        ('cursor', 'cursor'),
+        ('custom', 'custom'),
+        ('dashStyle', 'dash_style'),
+        ('dataLabels', 'data_labels'),
+        ('description', 'description'),
+        ('enableMouseTracking', 'enable_mouse_tracking'),
+        ('events', 'events'),
+        ('includeInDataExport', 'include_in_data_export'),
+        ('keys', 'keys'),
+        ('label', 'label'),
+        ('linkedTo', 'linked_to'),
+        ('marker', 'marker'),
+        ('onPoint', 'on_point'),
+        ('opacity', 'opacity'),
+        ('point', 'point'),
+        ('pointDescriptionFormatter', 'point_description_formatter'),
+        ('selected', 'selected'),
+        ('showCheckbox', 'show_checkbox'),
+        ('showInLegend', 'show_in_legend'),
+        ('skipKeyboardNavigation', 'skip_keyboard_navigation'),
+        ('sonification', 'sonification'),
+        ('states', 'states'),
+        ('stickyTracking', 'sticky_tracking'),
+        ('threshold', 'threshold'),
+        ('tooltip', 'tooltip'),
+        ('turboThreshold', 'turbo_threshold'),
+        ('visible', 'visible'),
+        ('animationLimit', 'animation_limit'),
+        ('boostBlending', 'boost_blending'),
+        ('boostThreshold', 'boost_threshold'),
+        ('colorIndex', 'color_index'),
+        ('colorKey', 'color_key'),
+        ('connectNulls', 'connect_nulls'),
+        ('crisp', 'crisp'),
+        ('cropThreshold', 'crop_threshold'),
+        ('dataSorting', 'data_sorting'),
+        ('findNearestPointBy', 'find_nearest_point_by'),
+        ('getExtremesFromAll', 'get_extremes_from_all'),
+        ('linecap', 'linecap'),
+        ('lineWidth', 'line_width'),
+        ('relativeXValue', 'relative_x_value'),
+        ('shadow', 'shadow'),
+        ('softThreshold', 'soft_threshold'),
+        ('step', 'step'),
+        ('zoneAxis', 'zone_axis'),
+        ('zones', 'zones'),
+        ('colorAxis', 'color_axis'),
+        ('connectEnds', 'connect_ends'),
+        ('dragDrop', 'drag_drop'),
+        ('negativeColor', 'negative_color'),
+        ('pointInterval', 'point_interval'),
+        ('pointIntervalUnit', 'point_interval_unit'),
+        ('pointPlacement', 'point_placement'),
+        ('pointStart', 'point_start'),
+        ('stacking', 'stacking'),
+        ('depth', 'depth'),
+        ('edgeColor', 'edge_color'),
+        ('edgeWidth', 'edge_width'),
+        ('grouping', 'grouping'),
+        ('groupPadding', 'group_padding'),
+        ('groupZPadding', 'group_z_padding'),
+        ('maxPointWidth', 'max_point_width'),
+        ('minPointLength', 'min_point_length'),
+        ('pointPadding', 'point_padding'),
+        ('pointRange', 'point_range'),
+        ('pointWidth', 'point_width'),
+        ('data', 'data'),
+        ('id', 'id'),
+        ('index', 'index'),
+        ('legendIndex', 'legend_index'),
+        ('name', 'name'),
+        ('stack', 'stack'),
+        ('xAxis', 'x_axis'),
+        ('yAxis', 'y_axis'),
+        ('zIndex', 'z_index'),
+        ('paths', 'paths'),
+    )
+
     def __init__(self, **kwargs):
         self._paths = None
         
@@ -179,104 +268,19 @@ class PictorialSeries(SeriesBase, PictorialOptions):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'step': as_dict.get('step', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'color_axis': as_dict.get('colorAxis', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'stacking': as_dict.get('stacking', None),
-            
-            'depth': as_dict.get('depth', None),
-            'edge_color': as_dict.get('edgeColor', None),
-            'edge_width': as_dict.get('edgeWidth', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'group_z_padding': as_dict.get('groupZPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-            
-            'paths': as_dict.get('paths', None),
-        }
+        kwargs = {name: as_dict.get(key, None) for key, name in cls._kwargs_fields}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'paths': self.paths
-        }
+        untrimmed = {}
+        paths = self.paths
+        if paths is not None:
+            untrimmed['paths'] = paths
+
         parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        for key, value in parent_as_dict.items():
+            if value is not None:
+                untrimmed[key] = value
 
         return untrimmed
@@ -2,10 +2,11 @@
 import csv
 import string
 import random
+from functools import lru_cache
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import constants, errors
 
 
 def get_random_string(length = 6):
@@ -76,13 +77,27 @@ def get_remaining_mro(cls,
       the MRO for ``cls``.
     :rtype: :class:`list <python:list>` of ``type`` objects
     """
-    mro = [x for x in cls.mro()
-           if hasattr(x, method) and x.__name__ != 'HighchartsMeta']
+    mro = _get_mro_with_method(cls, method)
     if in_cls is None:
-        return mro[1:]
+        return list(mro[1:])
     else:
         index = mro.index(in_cls)
-        return mro[(index + 1):]
+        return list(mro[(index + 1):])
+
+
+@lru_cache(maxsize = None)
+def _get_mro_with_method(cls, method):
+    """Return the classes in the MRO of ``cls`` that have ``method``, excluding
+    :class:`HighchartsMeta`.
+
+    .. note::
+
+      A class's MRO cannot change once it is created, so the result is cached per
+      ``(cls, method)``.
+
+    """
+    return tuple(x for x in cls.mro()
+                 if hasattr(x, method) and x.__name__ != 'HighchartsMeta')
 
 
 def mro__to_untrimmed_dict(obj, in_cls = None):
@@ -121,61 +136,160 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
     return consolidated
 
 
-def validate_color(value):
-    """Validate that ``value`` is either a :class:`Gradient`, :class:`Pattern`, or a
-    :class:`str <python:str>`.
+def fields_to_untrimmed_dict(obj, fields):
+    """Build the untrimmed :class:`dict <python:dict>` representation of ``obj`` from a
+    table of fields.
 
-    :param value: The value to validate.
+    Classes that serialize a fixed set of properties declare them as an
+    ``_untrimmed_fields`` tuple of ``(js_key, property_name)`` pairs and return the
+    result of this function from their ``_to_untrimmed_dict()`` method.
 
-    :returns: The validated value.
-    :rtype: :class:`str <python:str>`, :class:`Gradient`, :class:`Pattern``, or
-      :obj:`None <python:None>`
+    .. note::
+
+      Values are read through the public properties rather than the private
+      attributes behind them, so getters overridden in subclasses are respected.
+      Properties whose value is :obj:`None <python:None>` are omitted, since
+      :meth:`HighchartsMeta.trim_dict` would discard them anyway.
+
+    :param obj: The object to serialize.
+    :type obj: :class:`HighchartsMeta`
+
+    :param fields: The ``(js_key, property_name)`` pairs to read from ``obj``.
+    :type fields: :class:`tuple <python:tuple>` of :class:`tuple <python:tuple>`
+
+    :rtype: :class:`dict <python:dict>`
     """
+    untrimmed = {}
+    for key, name in fields:
+        value = getattr(obj, name)
+        if value is not None:
+            untrimmed[key] = value
+
+    return untrimmed
+
+
+_GRADIENT_KEYS = frozenset(['linearGradient', 'radialGradient'])
+_GRADIENT_SNAKE_KEYS = frozenset(['linear_gradient', 'radial_gradient'])
+_PATTERN_KEYS = frozenset(['patternOptions', 'pattern'])
+_PATTERN_SNAKE_KEYS = frozenset(['pattern_options'])
+_COLOR_KEYS = _GRADIENT_KEYS | _GRADIENT_SNAKE_KEYS | _PATTERN_KEYS | _PATTERN_SNAKE_KEYS
+
+
+def _validate_color_from_str(value):
+    """Resolve a :class:`str <python:str>` color value, which may contain a serialized
+    :class:`Gradient` or :class:`Pattern`."""
     from highcharts_core.utility_classes.gradients import Gradient
     from highcharts_core.utility_classes.patterns import Pattern
 
-    if not value:
-        return None
-    elif value.__class__.__name__ == 'EnforcedNullType':
-        return value
-    elif isinstance(value, (Gradient, Pattern)):
-        return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
+    if 'linearGradient' in value or 'radialGradient' in value:
         try:
-            value = Gradient.from_json(value)
+            return Gradient.from_json(value)
         except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
+            return validators.string(value)
+    elif 'patternOptions' in value or 'pattern' in value:
         try:
-            value = Pattern.from_json(value)
+            return Pattern.from_json(value)
         except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
+            return validators.string(value)
+
+    return validators.string(value)
+
+
+def _validate_color_from_dict(value):
+    """Resolve a :class:`dict <python:dict>` color value to a :class:`Gradient` or
+    :class:`Pattern`."""
+    from highcharts_core.utility_classes.gradients import Gradient
+    from highcharts_core.utility_classes.patterns import Pattern
+
+    keys = value.keys() & _COLOR_KEYS
+    if keys & _GRADIENT_KEYS:
+        return Gradient.from_dict(value)
+    elif keys & _GRADIENT_SNAKE_KEYS:
+        return Gradient(**value)
+    elif keys & _PATTERN_KEYS:
+        return Pattern.from_dict(value)
+    elif keys:
+        return Pattern(**value)
+
+    raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                      f'Gradient, or Pattern. Value received '
+                                      f'was: {value}')
+
+
+def _validate_color_passthrough(value):
+    """Return an already-resolved color value unchanged."""
+    return value
+
+
+def _validate_color_from_instance(value):
+    """Resolve a color value whose class is not yet registered in ``_COLOR_DISPATCH``.
+
+    Once the appropriate handler has been determined, it is registered against the
+    value's class so that subsequent values of the same class are dispatched directly.
+
+    .. note::
+
+      ``_COLOR_DISPATCH`` is a module-level registry that only ships with the built-in
+      :class:`str <python:str>`, :class:`dict <python:dict>`, and
+      :class:`EnforcedNullType` entries. It grows by one entry for each additional
+      class (e.g. :class:`Gradient`, :class:`Pattern`, or a
+      :class:`dict <python:dict>` / :class:`str <python:str>` subclass) that is
+      successfully resolved. Values that cannot be resolved are never registered, so
+      its size is bounded by the number of distinct color classes seen.
+    """
+    from highcharts_core.utility_classes.gradients import Gradient
+    from highcharts_core.utility_classes.patterns import Pattern
+
+    if isinstance(value, dict):
+        handler = _validate_color_from_dict
+    elif isinstance(value, (Gradient, Pattern)):
+        handler = _validate_color_passthrough
     elif isinstance(value, str):
-        value = validators.string(value)
+        handler = _validate_color_from_str
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
                                           f'was: {value}')
 
-    return value
+    _COLOR_DISPATCH[value.__class__] = handler
+
+    return handler(value)
+
+
+_COLOR_DISPATCH = {
+    str: _validate_color_from_str,
+    dict: _validate_color_from_dict,
+    constants.EnforcedNullType: _validate_color_passthrough,
+}
+
 
+def validate_color(value):
+    """Validate that ``value`` is either a :class:`Gradient`, :class:`Pattern`, or a
+    :class:`str <python:str>`.
+
+    :param value: The value to validate.
 
+    :returns: The validated value.
+    :rtype: :class:`str <python:str>`, :class:`Gradient`, :class:`Pattern``, or
+      :obj:`None <python:None>`
+    """
+    if not value:
+        return None
+
+    handler = _COLOR_DISPATCH.get(value.__class__, _validate_color_from_instance)
+
+    return handler(value)
+
+
+@lru_cache(maxsize = 4096)
 def to_camelCase(snake_case):
     """Convert ``snake_case`` to ``camelCase``.
 
+    .. note::
+
+      Results are cached, since the same (finite) set of keys is converted each time a
+      Highcharts for Python object is de-serialized.
+
     :param snake_case: A :class:`str <python:str>` which is likely to contain
       ``snake_case``.
     :type snake_case: :class:`str <python:str>`
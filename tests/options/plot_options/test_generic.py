@@ -298,3 +298,24 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'type': 'bar'}, errors.HighchartsReadOnlyError),
+    ({'type': None}, errors.HighchartsReadOnlyError),
+])
+def test__init__read_only_type(kwargs, error):
+    with pytest.raises(error):
+        result = cls(**kwargs)
+
+
+@pytest.mark.parametrize('data_labels, expected', [
+    ([{'enabled': True}, {}], [{'enabled': True}]),
+    ([[{'enabled': True}]], [[{'enabled': True}]]),
+])
+def test_data_labels_collection(data_labels, expected):
+    result = cls(data_labels = data_labels)
+    assert result.to_dict()['dataLabels'] == expected
+
+    result = cls.from_dict({'dataLabels': data_labels})
+    assert result.to_dict()['dataLabels'] == expected
@@ -38,6 +38,18 @@ STANDARD_PARAMS = [
       'size': '120',
       'start_angle': 0
     }, None),
+    ({
+      'background': [{
+          'className': 'test-class-name',
+          'innerRadius': 24,
+          'outerRadius': '105%',
+          'shape': 'arc'
+      }],
+      'center': [100, '50%'],
+      'inner_size': 20,
+      'size': '85%',
+      'start_angle': 0
+    }, None),
 
     ({
         'background': [{
@@ -54,10 +54,6 @@ def test_to_dict(kwargs, error):
      'chart_obj/01-expected.js',
      False,
      None),
-    ('chart_obj/01-input.js',
-     'chart_obj/01-expected.js',
-     False,
-     None),
 ])
 def test_from_js_literal(input_files, input_filename, expected_filename, as_file, error):
     Class_from_js_literal_with_expected(cls,
@@ -229,6 +229,8 @@ def test_validate_types_list(kwargs, error, result_class):
     ('{ "prop": 123 }', None, TestClass),
     # none
     (None, None, TestClass),
+    # instance
+    (TestClass(prop = 123), None, TestClass),
     # list and fails
     ([{ 'prop': 123 }, {'prop': 456 }], errors.HighchartsError, TestClass)
 ])
@@ -246,6 +248,13 @@ def test_class_sensitive(value, error, result_class):
             test_instance.prop = value
 
 
+def test_class_sensitive_instance_is_not_copied():
+    value = TestClass(prop = 123)
+    test_instance = TestDecoratedClass()
+    test_instance.prop = value
+    assert test_instance.prop is value
+
+
 @pytest.mark.parametrize('value, error, result_class', [
     # dict
     ([{ 'prop': 123 }, { 'prop': 456 }], None, TestClass),
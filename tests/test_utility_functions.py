@@ -4,7 +4,11 @@ import pytest
 
 from abc import ABC, abstractmethod
 
-from highcharts_core import utility_functions
+from collections import OrderedDict
+
+from highcharts_core import constants, errors, utility_functions
+from highcharts_core.utility_classes.gradients import Gradient
+from highcharts_core.utility_classes.patterns import Pattern
 
 
 @pytest.mark.parametrize('kwargs, expected_column_names, expected_records, error', [
@@ -22,4 +26,168 @@ def test_parse_csv(kwargs, expected_column_names, expected_records, error):
         assert len(records_as_dicts) == expected_records
     else:
         with pytest.raises(error):
-            result = utility_functions.parse_csv(**kwargs)
\ No newline at end of file
+            result = utility_functions.parse_csv(**kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({}, {}),
+    ({'background_color': '#ccc'}, {'backgroundColor': '#ccc'}),
+    ({'background_color': '#ccc', 'inner_radius': 0},
+     {'backgroundColor': '#ccc', 'innerRadius': 0}),
+])
+def test_fields_to_untrimmed_dict(kwargs, expected):
+    from highcharts_core.options.pane import PaneBackground
+
+    obj = PaneBackground(**kwargs)
+    result = utility_functions.fields_to_untrimmed_dict(obj, obj._untrimmed_fields)
+    assert result == expected
+
+
+@pytest.mark.parametrize('value, expected_type, error', [
+    (None, None, None),
+    ('', None, None),
+    ('#ccc', str, None),
+    ({
+        'linearGradient': {
+            'x1': 0,
+            'y1': 0,
+            'x2': 0,
+            'y2': 1
+        },
+        'stops': [[0, '#ffffff'], [1, '#e6e6e6']]
+     }, 'Gradient', None),
+    ({
+        'patternOptions': {
+            'path': 'M 0 0 L 10 10 M 9 -1 L 11 1 M -1 9 L 1 11',
+            'width': 10,
+            'height': 10
+        }
+     }, 'Pattern', None),
+    ({
+        'linear_gradient': {
+            'x1': 0,
+            'y1': 0,
+            'x2': 0,
+            'y2': 1
+        },
+        'stops': [[0, '#ffffff'], [1, '#e6e6e6']]
+     }, 'Gradient', None),
+    ({
+        'radialGradient': {
+            'cx': 0.5,
+            'cy': 0.5,
+            'r': 0.5
+        },
+        'stops': [[0, '#ffffff'], [1, '#e6e6e6']]
+     }, 'Gradient', None),
+    ({
+        'pattern_options': {
+            'path': 'M 0 0 L 10 10 M 9 -1 L 11 1 M -1 9 L 1 11',
+            'width': 10,
+            'height': 10
+        }
+     }, 'Pattern', None),
+    ({
+        'pattern': {
+            'path': 'M 0 0 L 10 10 M 9 -1 L 11 1 M -1 9 L 1 11',
+            'width': 10,
+            'height': 10
+        }
+     }, 'Pattern', None),
+    ('{"linearGradient": {"x1": 0, "y1": 0, "x2": 0, "y2": 1}, '
+     '"stops": [[0, "#ffffff"], [1, "#e6e6e6"]]}', 'Gradient', None),
+    ('linearGradient(not-json)', str, None),
+    (constants.EnforcedNull, constants.EnforcedNullType, None),
+
+    ({'not-a-color': 123}, None, errors.HighchartsValueError),
+    (123, None, errors.HighchartsValueError),
+])
+def test_validate_color(value, expected_type, error):
+    if not error:
+        result = utility_functions.validate_color(value)
+        if expected_type is None:
+            assert result is None
+        elif isinstance(expected_type, str):
+            assert result.__class__.__name__ == expected_type
+        else:
+            assert isinstance(result, expected_type)
+
+        assert utility_functions.validate_color(result) == result
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_color(value)
+
+
+class ColorDict(dict):
+    pass
+
+
+@pytest.mark.parametrize('value, expected_type, error', [
+    (Gradient.from_dict({
+        'linearGradient': {
+            'x1': 0,
+            'y1': 0,
+            'x2': 0,
+            'y2': 1
+        },
+        'stops': [[0, '#ffffff'], [1, '#e6e6e6']]
+    }), Gradient, None),
+    (Pattern.from_dict({
+        'patternOptions': {
+            'path': 'M 0 0 L 10 10 M 9 -1 L 11 1 M -1 9 L 1 11',
+            'width': 10,
+            'height': 10
+        }
+    }), Pattern, None),
+    (ColorDict({
+        'radialGradient': {
+            'cx': 0.5,
+            'cy': 0.5,
+            'r': 0.5
+        },
+        'stops': [[0, '#ffffff'], [1, '#e6e6e6']]
+    }), Gradient, None),
+    (OrderedDict({
+        'patternOptions': {
+            'path': 'M 0 0 L 10 10 M 9 -1 L 11 1 M -1 9 L 1 11',
+            'width': 10,
+            'height': 10
+        }
+    }), Pattern, None),
+
+    (123, None, errors.HighchartsValueError),
+    (12.3, None, errors.HighchartsValueError),
+])
+def test_validate_color_dispatch(monkeypatch, value, expected_type, error):
+    value_class = value.__class__
+    monkeypatch.delitem(utility_functions._COLOR_DISPATCH,
+                        value_class,
+                        raising = False)
+
+    if not error:
+        first_result = utility_functions.validate_color(value)
+        assert isinstance(first_result, expected_type) is True
+        if isinstance(value, expected_type):
+            assert first_result is value
+        assert value_class in utility_functions._COLOR_DISPATCH
+
+        handler = utility_functions._COLOR_DISPATCH[value_class]
+        calls = []
+        def recording_handler(item):
+            calls.append(item)
+            return handler(item)
+
+        monkeypatch.setitem(utility_functions._COLOR_DISPATCH,
+                            value_class,
+                            recording_handler)
+        second_result = utility_functions.validate_color(value)
+        assert calls == [value]
+        assert second_result.__class__ is first_result.__class__
+        assert second_result.to_dict() == first_result.to_dict()
+        if isinstance(value, expected_type):
+            assert second_result is value
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_color(value)
+
+        assert value_class not in utility_functions._COLOR_DISPATCH